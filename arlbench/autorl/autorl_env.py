@@ -227,12 +227,14 @@ class AutoRLEnv(gymnasium.Env):
 
         # The objectives are wrapped first since runtime should be accurate
         for o in self._objectives:
-            train_func = o(train_func, objectives, self._config["optimize_objectives"])
+            train_func = o.wrap(
+                train_func, objectives, self._config["optimize_objectives"]
+            )
 
         # Then we wrap the state features around the training function
         obs["steps"] = np.array([self._c_step, self._total_training_steps])
         for f in self._state_features:
-            train_func = f(train_func, obs)
+            train_func = f.wrap(train_func, obs)
 
         # Track configuration + budgets using deepcave (https://github.com/automl/DeepCAVE)
         if self._config.get("deep_cave", False):
@@ -5,7 +5,9 @@ import time
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING
 
+import jax
 import numpy as np
+from codecarbon import EmissionsTracker
 
 if TYPE_CHECKING:
     from arlbench.core.algorithms import TrainFunc
@@ -23,26 +25,15 @@ class Objective(ABC):
     """An abstract optimization objective for the AutoRL environment.
 
     It can be wrapped around the training function to calculate the objective.
-    We do this be overriding the __new__() function. It allows us to imitate
-    the behaviour of a basic function while keeping the advantages of a static class.
+    Objectives are not instantiated, instead the static wrap() function
+    is used to wrap the training function directly.
     """
     KEY: str  # Unique identifier
     RANK: int  # Sorting rank
 
-    def __new__(cls, *args, **kwargs) -> TrainFunc:
-        """Creates a new instance of this objective and directly wraps the train function.
-
-        This is done by first creating an object and subsequently calling self.__call__().
-
-        Returns:
-            TrainFunc: Wrapped training function.
-        """
-        instance = super().__new__(cls)
-        return instance.__call__(*args, **kwargs)
-
     @staticmethod
     @abstractmethod
-    def __call__(
+    def wrap(
         train_func: TrainFunc, objectives: dict, optimize_objectives: str
     ) -> TrainFunc:
         """Wraps the training function with the objective calculation.
@@ -67,17 +58,6 @@ class Objective(ABC):
         """
         raise NotImplementedError
 
-    def __lt__(self, other: Objective) -> bool:
-        """Implements "less-than" comparison between two objectives. Used for sorting based on objective rank.
-
-        Args:
-            other (Objective): Other Objective to compare to.
-
-        Returns:
-            bool: Whether this Objective is less than the other Objective.
-        """
-        return self.RANK < other.RANK
-
 
 class Runtime(Objective):
     """Runtime objective for the AutoRL environment. It measures the total training runtime."""
@@ -85,14 +65,17 @@ class Runtime(Objective):
     RANK = 0
 
     @staticmethod
-    def __call__(
+    def wrap(
         train_func: TrainFunc, objectives: dict, optimize_objectives: str
     ) -> TrainFunc:
         """Wraps the training function with the runtime calculation."""
         def wrapper(*args, **kwargs):
-            start_time = time.time()
+            start_time = time.perf_counter_ns()
             result = train_func(*args, **kwargs)
-            runtime = time.time() - start_time
+            # JAX dispatches asynchronously, so we have to wait for the
+            # training to actually finish before measuring the runtime
+            jax.block_until_ready(result)
+            runtime = (time.perf_counter_ns() - start_time) / 1e9
 
             # Naturally runtime is minimized. However, if we don't want
             # to minimize the objectives we have to flip the sign
@@ -117,7 +100,7 @@ class RewardMean(Objective):
     RANK = 2
 
     @staticmethod
-    def __call__(
+    def wrap(
         train_func: TrainFunc, objectives: dict, optimize_objectives: str
     ) -> TrainFunc:
         """Wraps the training function with the reward mean calculation."""
@@ -154,7 +137,7 @@ class RewardStd(Objective):
     RANK = 2
 
     @staticmethod
-    def __call__(
+    def wrap(
         train_func: TrainFunc, objectives: dict, optimize_objectives: str
     ) -> TrainFunc:
         """Wraps the training function with the reward standard deviation calculation."""
@@ -187,18 +170,22 @@ class Emissions(Objective):
     RANK = 1
 
     @staticmethod
-    def __call__(
+    def wrap(
         train_func: TrainFunc, objectives: dict, optimize_objectives: str
     ) -> TrainFunc:
         """Wraps the training function with the emissions calculation."""
         def wrapper(*args, **kwargs):
-            from codecarbon import EmissionsTracker
-
             tracker = EmissionsTracker(
                 save_to_file=False, output_dir="/tmp", logging_logger=None
             )
             tracker.start()
-            emissions = tracker.stop()
+            try:
+                result = train_func(*args, **kwargs)
+                # JAX dispatches asynchronously, so we have to wait for the
+                # training to actually finish before we stop tracking
+                jax.block_until_ready(result)
+            finally:
+                emissions = tracker.stop()
 
             # Naturally emissions are minimized. However, if we don't want
             # to minimize objectives we have to flip the sign
@@ -206,11 +193,6 @@ class Emissions(Objective):
                 emissions *= -1
 
             objectives[Emissions.KEY] = emissions
-
-            try:
-                result = train_func(*args, **kwargs)
-            finally:
-                objectives["emissions"] = emissions
             return result
 
         return wrapper
@@ -18,25 +18,14 @@ class StateFeature(ABC):
     """An abstract state features for the AutoRL environment.
 
     It can be wrapped around the training function to calculate the state features.
-    We do this be overriding the __new__() function. It allows us to imitate
-    the behaviour of a basic function while keeping the advantages of a static class.
+    State features are not instantiated, instead the static wrap() function
+    is used to wrap the training function directly.
     """
     KEY: str  # Unique identifier
 
-    def __new__(cls, *args, **kwargs) -> TrainFunc:
-        """Creates a new instance of this state feature and directly wraps the train function.
-
-        This is done by first creating an object and subsequently calling self.__call__().
-
-        Returns:
-            TrainFunc: Wrapped training function.
-        """
-        instance = super().__new__(cls)
-        return instance.__call__(*args, **kwargs)
-
     @staticmethod
     @abstractmethod
-    def __call__(train_func: TrainFunc, state_features: dict) -> TrainFunc:
+    def wrap(train_func: TrainFunc, state_features: dict) -> TrainFunc:
         """Wraps the training function with the state feature calculation.
 
         Args:
@@ -65,7 +54,7 @@ class GradInfo(StateFeature):
     KEY = "grad_info"
 
     @staticmethod
-    def __call__(train_func: TrainFunc, state_features: dict) -> TrainFunc:
+    def wrap(train_func: TrainFunc, state_features: dict) -> TrainFunc:
         """Wraps the training function with the gradient information calculation."""
         def wrapper(*args, **kwargs):
             result = train_func(*args, **kwargs)
@@ -284,10 +284,20 @@ class Algorithm(ABC):
         # Number of parallel evaluations, each with n_envs environments
         n_evals = int(np.ceil(num_eval_episodes / self.eval_env.n_envs))
 
-        _, rewards = jax.lax.scan(
-            self._env_episode, (runner_state.rng, runner_state), None, n_evals
-        )
-        return jnp.concat(rewards)[:num_eval_episodes]
+        if not self.eval_env.batchable:
+            _, rewards = jax.lax.scan(
+                self._env_episode, (runner_state.rng, runner_state), None, n_evals
+            )
+        else:
+            # Evaluation episodes are independent of each other,
+            # so we run all evaluations in parallel
+            eval_rngs = jax.random.split(runner_state.rng, n_evals)
+            # The runner state is not batched, so it is not broadcast in the output
+            _, rewards = jax.vmap(
+                self._env_episode, in_axes=((0, None), None), out_axes=((0, None), 0)
+            )((eval_rngs, runner_state), None)
+        # Rewards are already stacked with shape (n_evals, n_envs)
+        return rewards.reshape(-1)[:num_eval_episodes]
 
     def update_hpo_config(self, hpo_config: Configuration):
         """Update the hyperparameter configuration of the algorithm.
@@ -122,6 +122,47 @@ class Transition(NamedTuple):
 DQNTrainReturnT = tuple[DQNState, DQNTrainingResult]
 
 
+# The network and the optimizer are static fields of the DQNTrainState and thus part
+# of the cache key of all jitted functions. They are shared between instances with
+# the same configuration to avoid recompilation for every new DQN instance.
+@functools.lru_cache
+def _make_network(
+    network_cls: type[MLPQ | CNNQ],
+    action_size: int,
+    discrete: bool,
+    activation: str,
+    hidden_size: int,
+) -> MLPQ | CNNQ:
+    """Returns the (shared) Q-network for the given architecture."""
+    return network_cls(
+        action_size,
+        discrete=discrete,
+        activation=activation,
+        hidden_size=hidden_size,
+    )
+
+
+@functools.lru_cache
+def _make_optimizer(learning_rate: float) -> optax.GradientTransformation:
+    """Returns the (shared) Adam optimizer for the given learning rate."""
+    return optax.adam(learning_rate)
+
+
+def _importance_sampling_weights(priorities: jnp.ndarray, beta: float) -> jnp.ndarray:
+    """Normalized importance sampling weights (1/p)^beta / max((1/p)^beta),
+    computed with a single power and without the intermediate 1/p.
+
+    Args:
+        priorities (jnp.ndarray): Priorities of the sampled batch.
+        beta (float): Importance sampling exponent.
+
+    Returns:
+        jnp.ndarray: Importance sampling weights.
+    """
+    # Only equivalent for beta >= 0 (guaranteed by the buffer_beta search space)
+    return jnp.power(jnp.min(priorities) / priorities, beta)
+
+
 class DQN(Algorithm):
     """JAX-based implementation of Deep Q-Network (DQN)."""
 
@@ -170,13 +211,32 @@ class DQN(Algorithm):
         # For the network, we need the properties of the action space
         action_size, discrete = self.action_type
         network_cls = CNNQ if cnn_policy else MLPQ
-        self.network = network_cls(
+        self.network = _make_network(
+            network_cls,
             action_size,
-            discrete=discrete,
-            activation=self.nas_config["activation"],
-            hidden_size=self.nas_config["hidden_size"],
+            discrete,
+            self.nas_config["activation"],
+            self.nas_config["hidden_size"],
         )
 
+        # Observations of spaces with a narrow integer (or boolean) dtype, e.g. uint8
+        # images, are stored in the replay buffer using this dtype. This is lossless
+        # but reduces buffer memory and bandwidth compared to float32 observations
+        obs_dtype = getattr(self.env.observation_space, "dtype", None)
+        if obs_dtype is not None:
+            obs_dtype = jax.dtypes.canonicalize_dtype(obs_dtype)
+        if (
+            obs_dtype is not None
+            and (
+                jnp.issubdtype(obs_dtype, jnp.integer)
+                or jnp.issubdtype(obs_dtype, jnp.bool_)
+            )
+            and obs_dtype.itemsize < jnp.dtype(jnp.float32).itemsize
+        ):
+            self._buffer_obs_dtype = obs_dtype
+        else:
+            self._buffer_obs_dtype = None
+
         self.buffer = make_prioritised_item_buffer(
             max_length=self.hpo_config["buffer_size"],
             min_length=self.hpo_config["buffer_batch_size"],
@@ -199,6 +259,108 @@ class DQN(Algorithm):
             )
             self.buffer = self.buffer.replace(sample=sample_fn)
 
+        self._cache_hpo_config()
+
+        # The instance is a static argument of all jitted methods, so its hash must
+        # not change after construction
+        self._cache_key = self._jit_cache_key()
+
+    def _cache_hpo_config(self) -> None:
+        """Stores the hyperparameters that are used inside of jitted functions
+        as Python scalars. This way, they are folded into the computational graph
+        as constants instead of being looked up in the configuration during tracing.
+        """
+        n_envs = self.env.n_envs
+        self._gamma = float(self.hpo_config["gamma"])
+        self._buffer_beta = float(self.hpo_config["buffer_beta"])
+        self._buffer_epsilon = float(self.hpo_config["buffer_epsilon"])
+        self._initial_epsilon = float(self.hpo_config["initial_epsilon"])
+        self._target_epsilon = float(self.hpo_config["target_epsilon"])
+        self._exploration_fraction = float(self.hpo_config["exploration_fraction"])
+        self._train_freq = int(self.hpo_config["train_freq"])
+        self._gradient_steps = int(self.hpo_config["gradient_steps"])
+        # Number of (vectorized) environment steps before the training starts
+        self._learning_starts = int(self.hpo_config["learning_starts"]) // n_envs
+        if self.hpo_config["use_target_network"]:
+            self._tau = float(self.hpo_config["tau"])
+            # Number of (vectorized) environment steps between target network updates
+            self._target_update_interval = int(
+                np.ceil(self.hpo_config["target_update_interval"] / n_envs)
+            )
+
+    def _to_buffer_obs(self, obs: jnp.ndarray) -> jnp.ndarray:
+        """Converts observations to the dtype they are stored with in the replay buffer.
+
+        Args:
+            obs (jnp.ndarray): Observation(s).
+
+        Returns:
+            jnp.ndarray: Observation(s) to store in the replay buffer.
+        """
+        if self._buffer_obs_dtype is None:
+            return obs
+        return obs.astype(self._buffer_obs_dtype)
+
+    def _from_buffer_obs(self, obs: jnp.ndarray) -> jnp.ndarray:
+        """Converts observations sampled from the replay buffer to network inputs.
+
+        Args:
+            obs (jnp.ndarray): Observation(s) sampled from the replay buffer.
+
+        Returns:
+            jnp.ndarray: Observation(s) as float32.
+        """
+        if self._buffer_obs_dtype is None:
+            return obs
+        return obs.astype(jnp.float32)
+
+    def _jit_cache_key(self) -> tuple:
+        """Returns everything the jitted functions of this instance depend on.
+
+        The instance is a static argument of all jitted methods. By comparing instances
+        based on this key instead of their identity, new instances with the same
+        configuration (e.g., one per AutoRL step) reuse already compiled functions.
+        Together with the shared network and optimizer, this also holds for freshly
+        initialized states. The key is computed once in the constructor, since the
+        configuration of an instance must not change afterwards.
+
+        Returns:
+            tuple: Hashable cache key.
+        """
+        return (
+            type(self),
+            id(self.env),
+            id(self.eval_env),
+            tuple(sorted(dict(self.hpo_config).items())),
+            tuple(sorted(dict(self.nas_config).items())),
+            type(self.network),
+            self.eval_eps,
+            self.deterministic_eval,
+            self.track_metrics,
+            self.track_trajectories,
+        )
+
+    def __hash__(self) -> int:
+        return hash(self._cache_key)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, DQN):
+            return NotImplemented
+        return self._cache_key == other._cache_key
+
+    def update_hpo_config(self, hpo_config: Configuration):
+        """Not supported for DQN. The hyperparameters are part of the cache key of all
+        jitted functions and thus fixed after construction. Create a new DQN instance
+        with the new hyperparameter configuration instead.
+
+        Args:
+            hpo_config (Configuration): Hyperparameter configuration.
+        """
+        raise NotImplementedError(
+            "The hyperparameter configuration of DQN can not be updated. "
+            "Create a new DQN instance instead."
+        )
+
     @staticmethod
     def get_hpo_config_space(seed: int | None = None) -> ConfigurationSpace:
         """Returns the hyperparameter optimization (HPO) configuration space for DQN."""
@@ -350,9 +512,9 @@ class DQN(Algorithm):
             # This is how transitions will look like during training, so we need to pass one
             # once to the buffer to estimate and allocate the required buffer size
             _timestep = TimeStep(
-                last_obs=_obs[0],
-                obs=_obs[0],
-                action=_action[0],
+                last_obs=self._to_buffer_obs(_obs[0]),
+                obs=self._to_buffer_obs(_obs[0]),
+                action=_action[0].astype(jnp.int32),
                 reward=_reward[0],
                 done=_done[0],
             )
@@ -368,7 +530,7 @@ class DQN(Algorithm):
             "apply_fn": self.network.apply,
             "params": network_params,
             "target_params": target_params,
-            "tx": optax.adam(self.hpo_config["learning_rate"]),
+            "tx": _make_optimizer(self.hpo_config["learning_rate"]),
             "opt_state": opt_state,
         }
         train_state = DQNTrainState.create_with_opt_state(**train_state_kwargs)
@@ -388,7 +550,7 @@ class DQN(Algorithm):
 
         return DQNState(runner_state=runner_state, buffer_state=buffer_state)
 
-    @functools.partial(jax.jit, static_argnums=0)
+    @functools.partial(jax.jit, static_argnums=(0, 4))
     def predict(
         self,
         runner_state: DQNRunnerState,
@@ -402,7 +564,7 @@ class DQN(Algorithm):
             runner_state (DQNRunnerState): Algorithm runner state.
             obs (jnp.ndarray): Observation(s).
             rng (chex.PRNGKey | None, optional): Not used in DQN. Random generator key in other algorithms. Defaults to None.
-            deterministic (bool): Return deterministic action. Defaults to True.
+            deterministic (bool): Return deterministic action. Static argument, i.e., only the selected branch is compiled. Defaults to True.
 
         Returns:
             jnp.ndarray: Action(s).
@@ -410,9 +572,7 @@ class DQN(Algorithm):
 
         def random_action(rng: chex.PRNGKey, _) -> jnp.ndarray:
             _rngs = jax.random.split(rng, obs.shape[0])
-            return jnp.array(
-                [self.env.action_space.sample(_rngs[i]) for i in range(obs.shape[0])]
-            )
+            return jax.vmap(self.env.action_space.sample)(_rngs)
 
         def greedy_action(_: chex.PRNGKey, obs: jnp.ndarray) -> jnp.ndarray:
             if self.hpo_config["normalize_observations"]:
@@ -427,15 +587,11 @@ class DQN(Algorithm):
                 jax.random.uniform(rng, obs.shape[:1]) < self.eval_eps, rnd_action, grd_action
             )
 
-        return jax.lax.cond(
-            deterministic,
-            greedy_action,
-            sample_action,
-            rng,
-            obs,
-        )
+        if deterministic:
+            return greedy_action(rng, obs)
+        return sample_action(rng, obs)
 
-    @functools.partial(jax.jit, static_argnums=(0, 3, 4, 5), donate_argnums=(2,))
+    @functools.partial(jax.jit, static_argnums=(0, 3, 4, 5), donate_argnums=(1, 2))
     def train(
         self,
         runner_state: DQNRunnerState,
@@ -444,7 +600,8 @@ class DQN(Algorithm):
         n_eval_steps: int = 100,
         n_eval_episodes: int = 10,
     ) -> DQNTrainReturnT:
-        """Performs one full training.
+        """Performs one full training. The passed runner state and buffer state are
+        donated to XLA and must not be used after calling this function.
 
         Args:
             runner_state (DQNRunnerState): DQN runner state.
@@ -460,7 +617,7 @@ class DQN(Algorithm):
             np.ceil(
                 n_total_timesteps
                 / self.env.n_envs
-                / self.hpo_config["train_freq"]
+                / self._train_freq
                 / n_eval_steps
             )
         )
@@ -481,9 +638,9 @@ class DQN(Algorithm):
             """
             runner_state, buffer_state = carry
             (runner_state, buffer_state), (metrics, trajectories) = jax.lax.scan(
-                self._update_step,
+                lambda carry, _: self._update_step(carry, n_total_timesteps),
                 (runner_state, buffer_state),
-                jnp.array([n_total_timesteps] * n_update_steps),
+                None,
                 n_update_steps,
             )
             eval_returns = self.eval(runner_state, n_eval_episodes)
@@ -515,7 +672,7 @@ class DQN(Algorithm):
         Args:
             train_state (DQNTrainState): DQN training state.
             observations (jnp.ndarray): Batch of observations.
-            actions (jnp.ndarray): Batch of actions.
+            actions (jnp.ndarray): Batch of (int32) actions.
             next_observations (jnp.ndarray): Batch of next observations.
             rewards (jnp.ndarray): Batch of rewards.
             dones (jnp.ndarray): Batch of dones.
@@ -532,15 +689,15 @@ class DQN(Algorithm):
                 train_state.params, next_observations
             )  # (batch_size, num_actions)
         q_next_target = jnp.max(q_next_target, axis=-1)  # (batch_size,)
-        next_q_value = rewards + (1 - dones) * self.hpo_config["gamma"] * q_next_target
+        next_q_value = rewards + (1 - dones) * self._gamma * q_next_target
 
         def mse_loss(params: FrozenDict | dict) -> tuple[jnp.ndarray, jnp.ndarray]:
             q_pred = self.network.apply(
                 params, observations
             )  # (batch_size, num_actions)
-            q_pred = q_pred[
-                jnp.arange(q_pred.shape[0]), actions.squeeze().astype(int)
-            ]  # (batch_size,)
+            q_pred = jnp.take_along_axis(
+                q_pred, actions.reshape(-1, 1), axis=-1
+            ).squeeze(axis=-1)  # (batch_size,)
             td_error = q_pred - next_q_value
 
             loss = jnp.mean(is_weights * optax.l2_loss(q_pred, next_q_value))
@@ -576,7 +733,6 @@ class DQN(Algorithm):
 
         def take_step(
             carry: tuple[
-                chex.PRNGKey,
                 DQNTrainState,
                 RunningStatisticsState,
                 jnp.ndarray,
@@ -584,10 +740,9 @@ class DQN(Algorithm):
                 int,
                 PrioritisedTrajectoryBufferState,
             ],
-            _: None,
+            rng: chex.PRNGKey,
         ) -> tuple[
             tuple[
-                chex.PRNGKey,
                 DQNTrainState,
                 RunningStatisticsState,
                 jnp.ndarray,
@@ -600,14 +755,13 @@ class DQN(Algorithm):
             """Takes one environment step (n_envs many steps).
 
             Args:
-                carry (tuple[chex.PRNGKey, DQNTrainState, RunningStatisticsState, jnp.ndarray, Any, int, PrioritisedTrajectoryBufferState]): Carry for jax.lax.scan().
-                _ (None): Unused parameter.
+                carry (tuple[DQNTrainState, RunningStatisticsState, jnp.ndarray, Any, int, PrioritisedTrajectoryBufferState]): Carry for jax.lax.scan().
+                rng (chex.PRNGKey): Random number generator key of this step.
 
             Returns:
-                tuple[ tuple[ chex.PRNGKey, DQNTrainState, RunningStatisticsState, jnp.ndarray, Any, int, PrioritisedTrajectoryBufferState, ], tuple[jnp.ndarray, jnp.ndarray, jnp.ndarray, jnp.ndarray, dict], ]: _description_
+                tuple[ tuple[ DQNTrainState, RunningStatisticsState, jnp.ndarray, Any, int, PrioritisedTrajectoryBufferState, ], tuple[jnp.ndarray, jnp.ndarray, jnp.ndarray, jnp.ndarray, dict], ]: _description_
             """
             (
-                rng,
                 train_state,
                 normalizer_state,
                 last_obs,
@@ -648,29 +802,34 @@ class DQN(Algorithm):
 
                 return q_values.argmax(axis=-1)
 
-            rng, sample_rng, action_rng = jax.random.split(rng, 3)
-            training_fraction = jnp.min(
-                jnp.array([global_step * self.env.n_envs / n_total_timesteps, self.hpo_config["exploration_fraction"]])
+            sample_rng, action_rng, epsilon_rng, step_rng = jax.random.split(rng, 4)
+            training_fraction = jnp.minimum(
+                global_step * self.env.n_envs / n_total_timesteps,
+                self._exploration_fraction,
             )
-            epsilon = self.hpo_config["initial_epsilon"] - training_fraction * (
-                (self.hpo_config["initial_epsilon"] - self.hpo_config["target_epsilon"])
-                / self.hpo_config["exploration_fraction"]
+            epsilon = self._initial_epsilon - training_fraction * (
+                (self._initial_epsilon - self._target_epsilon)
+                / self._exploration_fraction
             )
             rand_action = random_action(sample_rng, last_obs)
             greedy_action = greedy_action(action_rng, last_obs)
             action = jax.lax.select(
-                jax.random.uniform(sample_rng, shape=last_obs.shape[:1]) < epsilon,
+                jax.random.uniform(epsilon_rng, shape=(self.env.n_envs,)) < epsilon,
                 rand_action,
                 greedy_action,
             )
 
-            rng, step_rng = jax.random.split(rng)
             env_state, (obsv, reward, done, info) = self.env.step(
                 env_state, action, step_rng
             )
 
+            # Actions are stored as int32 so they can be used as indices directly
             timestep = TimeStep(
-                last_obs=last_obs, obs=obsv, action=action, reward=reward, done=done
+                last_obs=self._to_buffer_obs(last_obs),
+                obs=self._to_buffer_obs(obsv),
+                action=action.astype(jnp.int32),
+                reward=reward,
+                done=done,
             )
             buffer_state = self.buffer.add(buffer_state, timestep)
 
@@ -689,7 +848,7 @@ class DQN(Algorithm):
                     target_params=optax.incremental_update(
                         train_state.params,
                         train_state.target_params,
-                        self.hpo_config["tau"],
+                        self._tau,
                     )
                 )
 
@@ -707,23 +866,13 @@ class DQN(Algorithm):
 
             if self.hpo_config["use_target_network"]:
                 train_state = jax.lax.cond(
-                    (
-                        global_step
-                        > self.hpo_config["learning_starts"] // self.env.n_envs
-                    )
-                    & (
-                        global_step
-                        % np.ceil(
-                            self.hpo_config["target_update_interval"] / self.env.n_envs
-                        )
-                        == 0
-                    ),
+                    (global_step > self._learning_starts)
+                    & (global_step % self._target_update_interval == 0),
                     target_update,
                     dont_target_update,
                     train_state,
                 )
             return (
-                rng,
                 train_state,
                 normalizer_state,
                 obsv,
@@ -780,19 +929,15 @@ class DQN(Algorithm):
                 rng, batch_sample_rng = jax.random.split(rng)
                 batch = self.buffer.sample(buffer_state, batch_sample_rng)
                 experience = batch.experience
+                last_obs = self._from_buffer_obs(experience.last_obs)
+                obs = self._from_buffer_obs(experience.obs)
                 if self.hpo_config["normalize_observations"]:
-                    last_obs = running_statistics.normalize(
-                        experience.last_obs, normalizer_state
-                    )
-                    obs = running_statistics.normalize(experience.obs, normalizer_state)
-                else:
-                    last_obs = experience.last_obs
-                    obs = experience.obs
+                    last_obs = running_statistics.normalize(last_obs, normalizer_state)
+                    obs = running_statistics.normalize(obs, normalizer_state)
                 if self.hpo_config["buffer_prio_sampling"]:
-                    is_weights = jnp.power(
-                        (1.0 / batch.priorities), self.hpo_config["buffer_beta"]
+                    is_weights = _importance_sampling_weights(
+                        batch.priorities, self._buffer_beta
                     )
-                    is_weights = is_weights / jnp.max(is_weights)
                 else:
                     is_weights = jnp.ones_like(batch.priorities)
                 train_state, loss, td_error, grads = self.update(
@@ -804,7 +949,7 @@ class DQN(Algorithm):
                     experience.reward,
                     experience.done,
                 )
-                new_priorities = jnp.abs(td_error) + self.hpo_config["buffer_epsilon"]
+                new_priorities = jnp.abs(td_error) + self._buffer_epsilon
                 buffer_state = self.buffer.set_priorities(
                     buffer_state, batch.indices, new_priorities
                 )
@@ -824,21 +969,17 @@ class DQN(Algorithm):
                 gradient_step,
                 (rng, train_state, buffer_state),
                 None,
-                self.hpo_config["gradient_steps"],
+                self._gradient_steps,
             )
             return rng, train_state, buffer_state, metrics
 
         def dont_update(
             rng: chex.PRNGKey,
             train_state: DQNTrainState,
-            normalizer_state: RunningStatisticsState, # noqa: ARG001
+            normalizer_state: RunningStatisticsState,
             buffer_state: PrioritisedTrajectoryBufferState,
         ) -> tuple[
-            chex.PRNGKey,
-            DQNTrainState,
-            RunningStatisticsState,
-            PrioritisedTrajectoryBufferState,
-            DQNMetrics,
+            chex.PRNGKey, DQNTrainState, PrioritisedTrajectoryBufferState, DQNMetrics
         ]:
             """Dummy function for jax.lax.cond(). Does not update the network.
 
@@ -849,37 +990,26 @@ class DQN(Algorithm):
                 buffer_state (PrioritisedTrajectoryBufferState): Buffer state.
 
             Returns:
-                tuple[chex.PRNGKey, DQNTrainState, RunningStatisticsState, PrioritisedTrajectoryBufferState, DQNMetrics]: Input parameters and dummy metrics.
+                tuple[chex.PRNGKey, DQNTrainState, PrioritisedTrajectoryBufferState, DQNMetrics]: Input parameters and zero-filled dummy metrics.
             """
             if self.track_metrics:
-                loss = jnp.array(
-                    [((jnp.array([0]) - jnp.array([0])) ** 2).mean()]
-                    * self.hpo_config["gradient_steps"]
+                # Zero-filled placeholders with the exact structure, shapes and
+                # dtypes of the metrics returned by do_update()
+                _, _, _, metrics = jax.eval_shape(
+                    do_update, rng, train_state, normalizer_state, buffer_state
                 )
-                td_error = jnp.array(
-                    [
-                        [[1] * self.hpo_config["buffer_batch_size"]]
-                        * self.hpo_config["gradient_steps"]
-                    ]
-                ).mean(axis=0)
-                grads = jax.tree_map(
-                    lambda x: jnp.stack([x] * self.hpo_config["gradient_steps"]),
-                    train_state.params,
+                metrics = jax.tree_map(
+                    lambda x: jnp.zeros(x.shape, dtype=x.dtype), metrics
                 )
             else:
-                loss = None
-                td_error = None
-                grads = None
-            return (
-                rng,
-                train_state,
-                buffer_state,
-                DQNMetrics(loss=loss, td_error=td_error, grads=grads),
-            )
+                metrics = DQNMetrics(loss=None, td_error=None, grads=None)
+            return rng, train_state, buffer_state, metrics
 
+        # One independent key for each of the train_freq environment steps
+        rngs = jax.random.split(rng, self._train_freq + 1)
+        rng, step_rngs = rngs[0], rngs[1:]
         (
             (
-                rng,
                 train_state,
                 normalizer_state,
                 last_obs,
@@ -897,7 +1027,6 @@ class DQN(Algorithm):
         ) = jax.lax.scan(
             take_step,
             (
-                rng,
                 train_state,
                 normalizer_state,
                 last_obs,
@@ -905,15 +1034,13 @@ class DQN(Algorithm):
                 global_step,
                 buffer_state,
             ),
-            None,
-            self.hpo_config["train_freq"],
+            step_rngs,
         )
         if self.hpo_config["normalize_observations"]:
             normalizer_state = running_statistics.update(normalizer_state, observations)
 
         rng, train_state, buffer_state, metrics = jax.lax.cond(
-            global_step
-            > np.ceil(self.hpo_config["learning_starts"] // self.env.n_envs),
+            global_step > self._learning_starts,
             do_update,
             dont_update,
             rng,
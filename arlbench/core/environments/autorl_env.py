@@ -101,9 +101,17 @@ class Environment(ABC):
             jnp.ndarray: Array of sampled actions, one for each environment.
         """
         _rngs = jax.random.split(rng, self._n_envs)
-        return jnp.array(
-            [self.action_space.sample(_rngs[i]) for i in range(self._n_envs)]
-        )
+        return jax.vmap(self.action_space.sample)(_rngs)
+
+    @property
+    def batchable(self) -> bool:
+        """Whether reset() and step() can be batched using jax.vmap. This is not
+        the case for environments that step an external simulator via callbacks.
+
+        Returns:
+            bool: True if the environment can be batched.
+        """
+        return True
 
     @property
     def n_envs(self) -> int:
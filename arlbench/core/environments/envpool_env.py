@@ -290,6 +290,11 @@ class EnvpoolEnv(Environment):
 
         return (env_state, new_lives), (obs, reward, done, info)
 
+    @property
+    def batchable(self) -> bool:
+        """The environment is stepped via callbacks and can not be batched."""
+        return False
+
     @property
     def action_space(self):
         """Action space of the environment."""
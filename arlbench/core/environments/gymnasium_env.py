@@ -117,6 +117,11 @@ class GymnasiumEnv(Environment):
 
         return None, (obs, reward, done, info)
 
+    @property
+    def batchable(self) -> bool:
+        """The environment is stepped via callbacks and can not be batched."""
+        return False
+
     @property
     def action_space(self):
         """Action space of the environment."""
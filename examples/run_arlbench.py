@@ -30,6 +30,9 @@ def execute(cfg: DictConfig):
     if cfg.jax_enable_x64:
         logger.info("Enabling x64 support for JAX.")
         jax.config.update("jax_enable_x64", True)
+    if cfg.get("jax_cache_dir"):
+        logger.info(f"Using persistent JAX compilation cache in {cfg.jax_cache_dir}.")
+        jax.config.update("jax_compilation_cache_dir", cfg.jax_cache_dir)
     try:
         return run(cfg, logger)
     except Exception:
@@ -0,0 +1,55 @@
+"""Tests for the shared algorithm functionality."""
+from __future__ import annotations
+
+import jax
+
+from arlbench.core.algorithms import DQN
+from arlbench.core.environments import make_env
+from arlbench.core.wrappers import Wrapper
+
+
+class NonBatchableWrapper(Wrapper):
+    """Marks an environment as not batchable, like the callback-based environments."""
+
+    @property
+    def batchable(self) -> bool:
+        return False
+
+
+def make_agent(env, eval_env=None) -> DQN:
+    hpo_config = dict(DQN.get_default_hpo_config())
+    hpo_config["buffer_size"] = 1024
+    return DQN(hpo_config, env, eval_env=eval_env)
+
+
+def eval_agent(agent: DQN, num_eval_episodes: int) -> tuple[list[str], tuple]:
+    """Returns the top-level primitives of the evaluation and the shape of its result."""
+    runner_state = agent.init(jax.random.PRNGKey(0)).runner_state
+    closed_jaxpr = jax.make_jaxpr(agent.eval, static_argnums=1)(
+        runner_state, num_eval_episodes
+    )
+    rewards = agent.eval(runner_state, num_eval_episodes)
+    return [eqn.primitive.name for eqn in closed_jaxpr.jaxpr.eqns], rewards.shape
+
+
+def test_eval_batchable_env():
+    env = make_env("gymnax", "CartPole-v1", n_envs=2, seed=42)
+    assert env.batchable
+    agent = make_agent(env)
+
+    primitives, shape = eval_agent(agent, 5)
+
+    assert "scan" not in primitives
+    assert shape == (5,)
+
+
+def test_eval_non_batchable_env():
+    env = make_env("gymnax", "CartPole-v1", n_envs=2, seed=42)
+    eval_env = NonBatchableWrapper(env)
+    assert not eval_env.batchable
+    agent = make_agent(env, eval_env=eval_env)
+
+    primitives, shape = eval_agent(agent, 5)
+
+    assert "scan" in primitives
+    assert shape == (5,)
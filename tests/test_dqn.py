@@ -0,0 +1,83 @@
+"""Tests for the DQN algorithm."""
+from __future__ import annotations
+
+import jax
+import jax.numpy as jnp
+import numpy as np
+import pytest
+
+from arlbench.core.algorithms import DQN
+from arlbench.core.algorithms.dqn.dqn import _importance_sampling_weights
+from arlbench.core.environments import make_env
+
+
+def make_hpo_config(**kwargs) -> dict:
+    hpo_config = dict(DQN.get_default_hpo_config())
+    hpo_config["buffer_size"] = 1024
+    hpo_config.update(kwargs)
+    return hpo_config
+
+
+def train(agent: DQN, seed: int = 0) -> None:
+    runner_state, buffer_state = agent.init(jax.random.PRNGKey(seed))
+    agent.train(
+        runner_state,
+        buffer_state,
+        n_total_timesteps=100,
+        n_eval_steps=1,
+        n_eval_episodes=1,
+    )
+
+
+def test_fresh_init_reuses_compiled_train():
+    env = make_env("gymnax", "CartPole-v1", n_envs=2, seed=42)
+    hpo_config = make_hpo_config()
+
+    cache_sizes = []
+    for seed in range(3):
+        train(DQN(hpo_config, env), seed)
+        cache_sizes.append(DQN.train._cache_size())
+
+    assert cache_sizes[1] == cache_sizes[0]
+    assert cache_sizes[2] == cache_sizes[0]
+
+
+def test_different_hpo_config_does_not_share_compiled_train():
+    env = make_env("gymnax", "CartPole-v1", n_envs=2, seed=42)
+    agent = DQN(make_hpo_config(gamma=0.9), env)
+    other_agent = DQN(make_hpo_config(gamma=0.95), env)
+    assert agent != other_agent
+
+    train(agent)
+    cache_size = DQN.train._cache_size()
+    train(other_agent)
+
+    assert DQN.train._cache_size() == cache_size + 1
+
+
+def test_update_hpo_config_is_not_supported():
+    env = make_env("gymnax", "CartPole-v1", n_envs=2, seed=42)
+    agent = DQN(make_hpo_config(), env)
+    cache_key = hash(agent)
+
+    with pytest.raises(NotImplementedError):
+        agent.update_hpo_config(make_hpo_config(gamma=0.9))
+    assert hash(agent) == cache_key
+
+
+@pytest.mark.parametrize("beta", [0.01, 0.5, 1.0])
+def test_importance_sampling_weights(beta):
+    priorities = jax.random.uniform(
+        jax.random.PRNGKey(0), (64,), minval=1e-6, maxval=10.0
+    )
+    # The minimum priority occurs twice in the second batch
+    priorities_with_duplicate_min = priorities.at[jnp.argmax(priorities)].set(
+        jnp.min(priorities)
+    )
+
+    for p in [priorities, priorities_with_duplicate_min]:
+        expected = jnp.power(1.0 / p, beta)
+        expected = expected / jnp.max(expected)
+        np.testing.assert_allclose(
+            _importance_sampling_weights(p, beta), expected, rtol=1e-5
+        )
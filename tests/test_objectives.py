@@ -0,0 +1,78 @@
+"""Tests for the AutoRL objectives."""
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from arlbench.autorl import objectives as objectives_module
+from arlbench.autorl.objectives import Emissions, RewardMean, Runtime
+from arlbench.core.algorithms import DQNTrainingResult
+
+
+@pytest.fixture
+def events(monkeypatch) -> list[str]:
+    """Replaces the codecarbon tracker by a stub that records when it is started and stopped."""
+    events = []
+
+    class StubEmissionsTracker:
+        def __init__(self, *args, **kwargs):
+            pass
+
+        def start(self):
+            events.append("start")
+
+        def stop(self) -> float:
+            events.append("stop")
+            return 0.5
+
+    monkeypatch.setattr(objectives_module, "EmissionsTracker", StubEmissionsTracker)
+    return events
+
+
+def make_train_func(events: list[str]):
+    def train_func(*args, **kwargs):
+        events.append("train")
+        return None, None
+
+    return train_func
+
+
+def test_emissions_tracks_training(events):
+    objectives = {}
+    train_func = Emissions.wrap(make_train_func(events), objectives, "lower")
+
+    train_func()
+
+    assert events == ["start", "train", "stop"]
+    assert objectives[Emissions.KEY] == 0.5
+
+
+def test_emissions_sign_flipped_for_upper(events):
+    objectives = {}
+    train_func = Emissions.wrap(make_train_func(events), objectives, "upper")
+
+    train_func()
+
+    assert events == ["start", "train", "stop"]
+    assert objectives[Emissions.KEY] == -0.5
+
+
+def test_wrap_objectives():
+    eval_rewards = np.array([[0.0, 0.0], [1.0, 3.0]])
+
+    def train_func(*args, **kwargs):
+        return None, DQNTrainingResult(
+            eval_rewards=eval_rewards, trajectories=None, metrics=None
+        )
+
+    # Objectives are wrapped around each other in the same way as in the AutoRLEnv
+    objectives = {}
+    wrapped_train_func = train_func
+    for o in [Runtime, RewardMean]:
+        wrapped_train_func = o.wrap(wrapped_train_func, objectives, "upper")
+
+    _, train_result = wrapped_train_func()
+
+    assert train_result.eval_rewards is eval_rewards
+    assert objectives[RewardMean.KEY] == 2.0
+    assert objectives[Runtime.KEY] <= 0.0
@@ -0,0 +1,26 @@
+"""Tests for the AutoRL state features."""
+from __future__ import annotations
+
+import jax.numpy as jnp
+import numpy as np
+
+from arlbench.autorl.state_features import GradInfo
+from arlbench.core.algorithms import DQNMetrics, DQNTrainingResult
+
+
+def test_wrap_grad_info():
+    grads = {"params": {"Dense_0": {"kernel": jnp.array([[3.0, 4.0]])}}}
+    metrics = DQNMetrics(loss=None, grads=grads, td_error=None)
+
+    def train_func(*args, **kwargs):
+        return None, DQNTrainingResult(
+            eval_rewards=None, trajectories=None, metrics=metrics
+        )
+
+    state_features = {}
+    wrapped_train_func = GradInfo.wrap(train_func, state_features)
+
+    _, train_result = wrapped_train_func()
+
+    assert train_result.metrics is metrics
+    np.testing.assert_allclose(state_features[GradInfo.KEY], [5.0, 0.25])